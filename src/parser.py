@@ -5,81 +5,147 @@ Extract and analyze financial data from SEC filings
 
 import re
 import json
-from typing import Dict, List, Tuple, Optional
+from dataclasses import asdict, dataclass, field, fields
+from functools import lru_cache
+from itertools import chain
+from multiprocessing import Pool
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Tuple, Optional
 from pathlib import Path
 from datetime import datetime
 import xml.etree.ElementTree as ET
 
+try:
+    import re2  # google-re2: linear-time matching, no backtracking blowups on long filings
+except ImportError:
+    re2 = None
+
+try:
+    import orjson  # fast JSON encoder for save_results
+except ImportError:
+    orjson = None
+
+
+# Filing section patterns, compiled once at import; matched against lowercased text
+_MDA_RE = re.compile(
+    r'(?:item\s+7|management.{0,50}discussion).{0,100}?(.{1,10000}?)(?:item\s+8|financial\s+statements)',
+    re.DOTALL
+)
+_RISK_RE = re.compile(
+    r'(?:item\s+1a|risk\s+factors).{0,100}?(.{1,10000}?)(?:item\s+1b|item\s+2)',
+    re.DOTALL
+)
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+# What follows a metric keyword: an amount on the same line, optionally in millions/billions
+_AMOUNT_TAIL = r'.*?[\$\s]+(?P<value>[\d,\.]+)\s*(?P<unit>million|billion)?'
+_PER_SHARE_TAIL = r'.*?[\$\s]+(?P<value>[\d,\.]+)'
+
+
+# Whitespace RE2's \s does not cover: Unicode spaces (\xa0 from HTML conversion is common
+# in EDGAR text), \v and the ASCII separators \x1c-\x1f
+_OTHER_SPACE_RE = re.compile(r'[^\S \t\n\r\f]')
+
+
+def _normalize_whitespace(text: str) -> str:
+    '''Turn whitespace that RE2's \\s misses into plain spaces; keeps the text length'''
+    return _OTHER_SPACE_RE.sub(' ', text)
+
+
+def _ascii_ci(literal: str) -> str:
+    '''Case-insensitive pattern for a literal using ASCII classes, e.g. 'Inc.' -> [Ii][Nn][Cc]\\.'''
+    return ''.join(f'[{char.upper()}{char.lower()}]' if char.isalpha() else re.escape(char) for char in literal)
+
+
+# What _compile_linear returns: a re.Pattern, or an re2._Regexp with the same match API
+_Regex = Any
+
+
+def _compile_linear(pattern: str) -> _Regex:
+    '''Compile with RE2 when installed and the pattern is supported, else fall back to re'''
+    # RE2 takes no re flags, and its (?i) folds Unicode case (e.g. the Kelvin sign matches k)
+    # where re.ASCII does not, so patterns spell case-insensitivity with _ascii_ci. RE2's
+    # \s, \d, \w and \b are ASCII-only, so the re fallback uses re.ASCII: results must not
+    # depend on whether the optional package is installed. Callers normalize whitespace first.
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern, re.ASCII)
+
 
 class FinancialMetricExtractor:
     '''Extract financial metrics from text'''
     
-    def __init__(self):
-        self.patterns = self._load_patterns()
-        
-    def _load_patterns(self) -> Dict[str, re.Pattern]:
-        '''Compiled regex patterns for financial metrics'''
-        return {
-            'revenue': re.compile(
-                r'(?:revenue|sales|net\s+sales).*?[\$\s]+([\d,\.]+)\s*(?:million|billion)?',
-                re.IGNORECASE
-            ),
-            'net_income': re.compile(
-                r'net\s+income.*?[\$\s]+([\d,\.]+)\s*(?:million|billion)?',
-                re.IGNORECASE
-            ),
-            'earnings_per_share': re.compile(
-                r'earnings\s+per\s+share.*?[\$\s]+([\d,\.]+)',
-                re.IGNORECASE
-            ),
-            'gross_profit': re.compile(
-                r'gross\s+profit.*?[\$\s]+([\d,\.]+)\s*(?:million|billion)?',
-                re.IGNORECASE
-            ),
-            'operating_income': re.compile(
-                r'operating\s+income.*?[\$\s]+([\d,\.]+)\s*(?:million|billion)?',
-                re.IGNORECASE
-            ),
-            'total_assets': re.compile(
-                r'total\s+assets.*?[\$\s]+([\d,\.]+)\s*(?:million|billion)?',
-                re.IGNORECASE
-            ),
-            'total_liabilities': re.compile(
-                r'total\s+liabilities.*?[\$\s]+([\d,\.]+)\s*(?:million|billion)?',
-                re.IGNORECASE
-            ),
-            'cash_and_equivalents': re.compile(
-                r'cash\s+(?:and\s+)?(?:cash\s+)?equivalents.*?[\$\s]+([\d,\.]+)\s*(?:million|billion)?',
-                re.IGNORECASE
-            ),
-            'stockholders_equity': re.compile(
-                r'(?:stockholders|shareholders)\s+equity.*?[\$\s]+([\d,\.]+)\s*(?:million|billion)?',
-                re.IGNORECASE
-            )
-        }
-        
-    def extract_metrics(self, text: str) -> Dict[str, float]:
-        '''Extract all financial metrics from text'''
+    # Keyword that opens each financial metric; the amount follows later on the same line.
+    # Built at class scope so they are compiled once per process, not per instance.
+    _KEYWORDS: ClassVar[Dict[str, str]] = {
+        'revenue': r'(?:revenue|sales|net\s+sales)',
+        'net_income': r'net\s+income',
+        'earnings_per_share': r'earnings\s+per\s+share',
+        'gross_profit': r'gross\s+profit',
+        'operating_income': r'operating\s+income',
+        'total_assets': r'total\s+assets',
+        'total_liabilities': r'total\s+liabilities',
+        'cash_and_equivalents': r'cash\s+(?:and\s+)?(?:cash\s+)?equivalents',
+        'stockholders_equity': r'(?:stockholders|shareholders)\s+equity'
+    }
+    # Full per-metric patterns, capturing <value> and, except per-share amounts, <unit>.
+    # They are lowercase and run against lowercased text, so no IGNORECASE is needed.
+    # Both scans here use re (ASCII, matching the RE2 helpers), not _compile_linear: the
+    # patterns are only anchored at a keyword hit, where .*? stops at the end of the line,
+    # whereas every RE2 match(text, pos) costs O(len(text)) and made the loop quadratic
+    _PATTERNS: ClassVar[Dict[str, re.Pattern]] = {
+        name: re.compile(keyword + (_PER_SHARE_TAIL if name == 'earnings_per_share' else _AMOUNT_TAIL), re.ASCII)
+        for name, keyword in _KEYWORDS.items()
+    }
+    # Keywords only, fused into one named alternation so the text is scanned once. Scanning
+    # full patterns here would let one metric's span swallow the keyword of the next.
+    _KEYWORD_SCAN: ClassVar[re.Pattern] = re.compile(
+        '|'.join(f'(?P<{name}>{keyword})' for name, keyword in _KEYWORDS.items()), re.ASCII
+    )
+    # Display names for reports, title-cased once rather than per report line
+    METRIC_TITLES: ClassVar[Dict[str, str]] = {name: name.replace('_', ' ').title() for name in _PATTERNS}
+        
+    def extract_metrics(self, text: str, text_lower: Optional[str] = None) -> Dict[str, float]:
+        '''Extract all financial metrics from text (pass text_lower to reuse a normalized, lowercased copy)'''
+        if text_lower is None:
+            text_lower = _normalize_whitespace(text).lower()
+            
         metrics = {}
+        seen = set()
         
-        for metric_name, pattern in self.patterns.items():
-            match = pattern.search(text)
-            if match:
-                value_str = match.group(1).replace(',', '')
-                try:
-                    value = float(value_str)
-                    
-                    # Check for billion/million multiplier
-                    context = text[max(0, match.start()-50):match.end()+20]
-                    # normalise to millions so all metrics share a common unit scale
-                    if 'billion' in context.lower():
-                        value *= 1000  # Convert to millions
-                        
-                    metrics[metric_name] = value
-                except ValueError:
-                    pass
+        for hit in self._KEYWORD_SCAN.finditer(text_lower):
+            metric_name = hit.lastgroup
+            if metric_name in seen:
+                continue
+                
+            # Anchor the metric's own pattern at its keyword, same as its leftmost search hit
+            pattern = self._PATTERNS[metric_name]
+            match = pattern.match(text_lower, hit.start())
+            if not match:
+                continue
+            seen.add(metric_name)  # Only the first hit per metric counts
+            
+            value_str = match.group('value')
+            if ',' in value_str:  # Most captures have no thousands separator
+                value_str = value_str.replace(',', '')
+            try:
+                value = float(value_str)
+                
+                # Check for billion/million multiplier captured right after the number;
+                # normalise to millions so all metrics share a common unit scale
+                if 'unit' in pattern.groupindex and match.group('unit') == 'billion':
+                    value *= 1000  # Convert to millions
                     
-        return metrics
+                metrics[metric_name] = value
+            except ValueError:
+                pass
+                
+            if len(seen) == len(self._PATTERNS):
+                break
+                
+        # Report metrics in pattern order rather than text order
+        return {name: metrics[name] for name in self._PATTERNS if name in metrics}
         
     def calculate_ratios(self, metrics: Dict[str, float]) -> Dict[str, float]:
         '''Calculate financial ratios from extracted metrics'''
@@ -112,35 +178,38 @@ class FinancialMetricExtractor:
 class SentimentAnalyzer:
     '''Analyze sentiment in financial text (MD&A, risk factors)'''
     
-    def __init__(self):
-        self.lexicons = self._load_lexicons()
-        
-    def _load_lexicons(self) -> Dict[str, List[str]]:
-        '''Financial sentiment lexicons'''
-        return {
-            'positive': [
-                'growth', 'increase', 'improved', 'strong', 'positive',
-                'gain', 'profit', 'success', 'opportunity', 'favorable',
-                'expand', 'efficient', 'excellent', 'robust', 'momentum',
-                'outperform', 'exceeded', 'innovative', 'competitive'
-            ],
-            'negative': [
-                'decline', 'decrease', 'loss', 'weak', 'negative',
-                'risk', 'challenge', 'concern', 'adverse', 'difficult',
-                'uncertainty', 'volatile', 'impairment', 'litigation',
-                'default', 'breach', 'deteriorate', 'unsuccessful'
-            ],
-            'uncertainty': [
-                'may', 'could', 'might', 'uncertain', 'estimate',
-                'believe', 'expect', 'anticipate', 'subject to',
-                'depends', 'varies', 'fluctuate'
-            ]
-        }
-        
-    def analyze_text(self, text: str) -> Dict:
-        '''Analyze sentiment of text'''
-        text_lower = text.lower()
-        words = text_lower.split()
+    # Financial sentiment lexicons
+    _LEXICONS: ClassVar[Dict[str, List[str]]] = {
+        'positive': [
+            'growth', 'increase', 'improved', 'strong', 'positive',
+            'gain', 'profit', 'success', 'opportunity', 'favorable',
+            'expand', 'efficient', 'excellent', 'robust', 'momentum',
+            'outperform', 'exceeded', 'innovative', 'competitive'
+        ],
+        'negative': [
+            'decline', 'decrease', 'loss', 'weak', 'negative',
+            'risk', 'challenge', 'concern', 'adverse', 'difficult',
+            'uncertainty', 'volatile', 'impairment', 'litigation',
+            'default', 'breach', 'deteriorate', 'unsuccessful'
+        ],
+        'uncertainty': [
+            'may', 'could', 'might', 'uncertain', 'estimate',
+            'believe', 'expect', 'anticipate', 'subject to',
+            'depends', 'varies', 'fluctuate'
+        ]
+    }
+    # One whole-word alternation over every lexicon, a named group per category
+    _PATTERN: ClassVar[_Regex] = _compile_linear(
+        r'\b(?:' + '|'.join(
+            f'(?P<{category}>' + '|'.join(re.escape(word.lower()) for word in lexicon) + ')'
+            for category, lexicon in _LEXICONS.items()
+        ) + r')\b'
+    )
+        
+    def analyze_text(self, text: str, text_lower: Optional[str] = None) -> Dict:
+        '''Analyze sentiment of text (pass text_lower to reuse a normalized, lowercased copy)'''
+        if text_lower is None:
+            text_lower = _normalize_whitespace(text).lower()
         
         counts = {
             'positive': 0,
@@ -148,10 +217,10 @@ class SentimentAnalyzer:
             'uncertainty': 0
         }
         
-        # Count sentiment words
-        for category, lexicon in self.lexicons.items():
-            for word in lexicon:
-                counts[category] += text_lower.count(word)
+        # Count sentiment words, whole words only (so 'may' does not fire
+        # inside 'dismay'); text is lowercased up front instead of IGNORECASE
+        for match in self._PATTERN.finditer(text_lower):
+            counts[match.lastgroup] += 1
                 
         # Calculate scores
         total = sum(counts.values())
@@ -182,39 +251,102 @@ class SentimentAnalyzer:
 class EntityExtractor:
     '''Extract named entities (companies, people, locations)'''
     
-    def __init__(self):
-        self.patterns = self._load_patterns()
-        
-    def _load_patterns(self) -> Dict[str, re.Pattern]:
-        '''Entity extraction patterns'''
-        return {
-            # pattern requires legal suffix (Inc., Corp., LLC, Ltd.) — bare company names are not matched
-            'company': re.compile(r'\b(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Inc\.|Corp\.|LLC|Ltd\.)', re.IGNORECASE),
-            'date': re.compile(r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}', re.IGNORECASE),
-            'money': re.compile(r'\$[\d,]+(?:\.\d{2})?'),
-            'percentage': re.compile(r'\d+(?:\.\d+)?%')
-        }
-        
-    def extract_entities(self, text: str) -> Dict[str, List[str]]:
-        '''Extract all entities from text'''
+    # Entity extraction patterns
+    _PATTERNS: ClassVar[Dict[str, _Regex]] = {
+        # pattern requires legal suffix (Inc., Corp., LLC, Ltd.) — bare company names are not matched
+        'company': _compile_linear(
+            r'\b(?:[A-Za-z][A-Za-z]+(?:\s+[A-Za-z][A-Za-z]+)*)\s+(?:'
+            + '|'.join(map(_ascii_ci, ['Inc.', 'Corp.', 'LLC', 'Ltd.'])) + ')'
+        ),
+        'date': _compile_linear(
+            '(?:' + '|'.join(map(_ascii_ci, ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+                                              'August', 'September', 'October', 'November', 'December']))
+            + r')\s+\d{1,2},?\s+\d{4}'
+        ),
+        'money': _compile_linear(r'\$[\d,]+(?:\.\d{2})?'),
+        'percentage': _compile_linear(r'\d+(?:\.\d+)?%')
+    }
+        
+    def extract_entities(self, text: str, normalized: bool = False) -> Dict[str, List[str]]:
+        '''Extract all entities from text (pass normalized=True if whitespace is already normalized)'''
+        if not normalized:
+            text = _normalize_whitespace(text)
         entities = {}
         
-        for entity_type, pattern in self.patterns.items():
-            matches = pattern.findall(text)
-            entities[entity_type] = list(set(matches))  # Unique matches
+        for entity_type, pattern in self._PATTERNS.items():
+            # Stream matches straight into a set so duplicates are never held as a list
+            unique = {match.group(0) for match in pattern.finditer(text)}
+            entities[entity_type] = list(unique)
             
         return entities
 
 
+@dataclass(slots=True)
+class FilingResult:
+    '''Parsed SEC filing, as returned by SECFilingParser.parse_filing'''
+    ticker: Optional[str] = None
+    filing_type: Optional[str] = None
+    parsed_date: Optional[str] = None
+    metrics: Dict[str, float] = field(default_factory=dict)
+    ratios: Dict[str, float] = field(default_factory=dict)
+    sentiment: Dict = field(default_factory=dict)
+    entities: Dict[str, List[str]] = field(default_factory=dict)
+    risks: List[str] = field(default_factory=list)
+    sections: Dict[str, int] = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FilingResult':
+        '''Build from a result dict (e.g. reloaded JSON); missing keys take the defaults'''
+        return cls(**{key: value for key, value in data.items() if key in _FILING_RESULT_FIELD_SET})
+        
+    # Read-only mapping access (result['metrics'], 'risks' in result, dict(result)) so
+    # callers written against the old dict result keep working; prefer attributes
+    def keys(self) -> Tuple[str, ...]:
+        '''Field names, in declaration order'''
+        return _FILING_RESULT_FIELDS
+        
+    def __contains__(self, key) -> bool:
+        return key in _FILING_RESULT_FIELD_SET
+        
+    def __getitem__(self, key: str):
+        if key not in _FILING_RESULT_FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+        
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FILING_RESULT_FIELDS)
+        
+    def __len__(self) -> int:
+        return len(_FILING_RESULT_FIELDS)
+        
+    def get(self, key: str, default=None):
+        '''Dict-style get'''
+        return getattr(self, key) if key in _FILING_RESULT_FIELD_SET else default
+        
+    def to_dict(self) -> Dict:
+        '''Plain nested dict, e.g. for JSON'''
+        return asdict(self)
+
+
+# FilingResult field names, computed once for the mapping helpers
+_FILING_RESULT_FIELDS = tuple(f.name for f in fields(FilingResult))
+_FILING_RESULT_FIELD_SET = frozenset(_FILING_RESULT_FIELDS)
+
+
 class SECFilingParser:
     '''Complete SEC filing parser'''
     
+    _RISK_KEYWORDS: ClassVar[List[str]] = ['risk', 'uncertainty', 'adverse', 'challenge', 'concern']
+    # Single alternation over the risk keywords, matched as substrings
+    _RISK_PATTERN: ClassVar[re.Pattern] = re.compile('|'.join(map(re.escape, _RISK_KEYWORDS)), re.IGNORECASE)
+    
     def __init__(self):
         self.metric_extractor = FinancialMetricExtractor()
         self.sentiment_analyzer = SentimentAnalyzer()
         self.entity_extractor = EntityExtractor()
         
-    def parse_filing(self, text: str, ticker: str = None, filing_type: str = '10-K') -> Dict:
+    def parse_filing(self, text: str, ticker: str = None, filing_type: str = '10-K',
+                     verbose: bool = True) -> FilingResult:
         '''
         Parse complete SEC filing
         
@@ -222,158 +354,214 @@ class SECFilingParser:
             text: Filing text content
             ticker: Company ticker symbol
             filing_type: Type of filing (10-K, 10-Q, etc.)
+            verbose: Print progress for each parsing step
             
         Returns:
             Parsed filing data
         '''
-        print(f'\n📄 Parsing {filing_type} filing...')
+        if verbose:
+            print(f'\n📄 Parsing {filing_type} filing...')
+        
+        # Normalize whitespace and lowercase once, shared across the extractors
+        text = _normalize_whitespace(text)
+        text_lower = text.lower()
         
         # Extract sections
-        sections = self._extract_sections(text)
+        sections, section_lengths = self._extract_sections(text_lower)
         
         # Extract financial metrics
-        print('  Extracting financial metrics...')
-        metrics = self.metric_extractor.extract_metrics(text)
+        if verbose:
+            print('  Extracting financial metrics...')
+        metrics = self.metric_extractor.extract_metrics(text, text_lower)
         ratios = self.metric_extractor.calculate_ratios(metrics)
         
         # Analyze sentiment
-        print('  Analyzing sentiment...')
-        mda_text = sections.get('mda', text[:5000])  # First 5000 chars if no section
-        sentiment = self.sentiment_analyzer.analyze_text(mda_text)
+        if verbose:
+            print('  Analyzing sentiment...')
+        mda_text = sections.get('mda', text_lower[:5000])  # First 5000 chars if no section
+        sentiment = self.sentiment_analyzer.analyze_text(mda_text, mda_text)
         
         # Extract entities
-        print('  Extracting entities...')
-        entities = self.entity_extractor.extract_entities(text)
+        if verbose:
+            print('  Extracting entities...')
+        entities = self.entity_extractor.extract_entities(text, normalized=True)
         
         # Extract risk factors
-        print('  Identifying risk factors...')
+        if verbose:
+            print('  Identifying risk factors...')
         risks = self._extract_risk_factors(text)
         
-        result = {
-            'ticker': ticker,
-            'filing_type': filing_type,
-            'parsed_date': datetime.now().isoformat(),
-            'metrics': metrics,
-            'ratios': ratios,
-            'sentiment': sentiment,
-            'entities': entities,
-            'risks': risks,
-            'sections': {k: len(v) for k, v in sections.items()}
-        }
+        result = FilingResult(
+            ticker=ticker,
+            filing_type=filing_type,
+            parsed_date=datetime.now().isoformat(),
+            metrics=metrics,
+            ratios=ratios,
+            sentiment=sentiment,
+            entities=entities,
+            risks=risks,
+            sections=section_lengths
+        )
         
-        print('  ✅ Parsing complete')
+        if verbose:
+            print('  ✅ Parsing complete')
         
         return result
         
-    def _extract_sections(self, text: str) -> Dict[str, str]:
-        '''Extract major sections from filing'''
+    def _extract_sections(self, text_lower: str) -> Tuple[Dict[str, str], Dict[str, int]]:
+        '''
+        Extract major sections from lowercased filing text
+        
+        Returns:
+            Section texts that later steps read (only MD&A), and lengths of every section found
+        '''
         sections = {}
+        lengths = {}
         
         # MD&A section
-        mda_match = re.search(
-            r'(?:ITEM\s+7|Management.{0,50}Discussion).{0,100}?(.{1,10000}?)(?:ITEM\s+8|Financial\s+Statements)',
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
+        mda_match = _MDA_RE.search(text_lower)
         if mda_match:
             sections['mda'] = mda_match.group(1)
+            lengths['mda'] = len(sections['mda'])
             
-        # Risk factors
-        risk_match = re.search(
-            r'(?:ITEM\s+1A|Risk\s+Factors).{0,100}?(.{1,10000}?)(?:ITEM\s+1B|ITEM\s+2)',
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
+        # Risk factors (only the length is reported, so don't slice the text out)
+        risk_match = _RISK_RE.search(text_lower)
         if risk_match:
-            sections['risk_factors'] = risk_match.group(1)
+            lengths['risk_factors'] = risk_match.end(1) - risk_match.start(1)
             
-        return sections
+        return sections, lengths
         
     def _extract_risk_factors(self, text: str) -> List[str]:
         '''Extract risk factor sentences'''
-        risk_keywords = ['risk', 'uncertainty', 'adverse', 'challenge', 'concern']
-        
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        
+        # Stream sentence boundaries; a sentence is only sliced once a keyword is found in it
         risks = []
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            if any(keyword in sentence_lower for keyword in risk_keywords):
-                if len(sentence.strip()) > 50:  # Meaningful length
-                    risks.append(sentence.strip())
-                    
-        return risks[:10]  # Top 10 risks
+        start = 0
+        for boundary in chain(_SENTENCE_SPLIT_RE.finditer(text), (None,)):  # None: trailing sentence
+            end = boundary.start() if boundary else len(text)
+            if self._RISK_PATTERN.search(text, start, end):
+                sentence = text[start:end].strip()
+                if len(sentence) > 50:  # Meaningful length
+                    risks.append(sentence)
+                    if len(risks) == 10:  # Top 10 risks
+                        break
+            if boundary:
+                start = boundary.end()
+                
+        return risks
         
-    def generate_report(self, parsed_data: Dict) -> str:
-        '''Generate human-readable report'''
+    def generate_report(self, parsed_data: FilingResult) -> str:
+        '''Generate human-readable report from a FilingResult or an equivalent dict (e.g. reloaded JSON)'''
+        if isinstance(parsed_data, dict):
+            parsed_data = FilingResult.from_dict(parsed_data)
+            
         report = []
+        report_append = report.append
+        metric_titles = FinancialMetricExtractor.METRIC_TITLES
         
-        report.append(f"Financial Analysis Report")
-        report.append(f"{'='*60}")
-        report.append(f"Ticker: {parsed_data.get('ticker', 'N/A')}")
-        report.append(f"Filing: {parsed_data.get('filing_type', 'N/A')}")
-        report.append(f"")
+        report_append("Financial Analysis Report")
+        report_append(f"{'='*60}")
+        report_append(f"Ticker: {'N/A' if parsed_data.ticker is None else parsed_data.ticker}")
+        report_append(f"Filing: {'N/A' if parsed_data.filing_type is None else parsed_data.filing_type}")
+        report_append("")
         
         # Metrics
-        if parsed_data.get('metrics'):
-            report.append("Financial Metrics (in millions):")
-            report.append("-" * 40)
-            for metric, value in parsed_data['metrics'].items():
-                report.append(f"  {metric.replace('_', ' ').title()}: ${value:,.1f}M")
-            report.append("")
+        if parsed_data.metrics:
+            report_append("Financial Metrics (in millions):")
+            report_append("-" * 40)
+            for metric, value in parsed_data.metrics.items():
+                title = metric_titles.get(metric) or metric.replace('_', ' ').title()
+                report_append(f"  {title}: ${value:,.1f}M")
+            report_append("")
             
         # Ratios
-        if parsed_data.get('ratios'):
-            report.append("Financial Ratios:")
-            report.append("-" * 40)
-            for ratio, value in parsed_data['ratios'].items():
+        if parsed_data.ratios:
+            report_append("Financial Ratios:")
+            report_append("-" * 40)
+            for ratio, value in parsed_data.ratios.items():
+                title = ratio.replace('_', ' ').title()
                 if 'margin' in ratio or 'return' in ratio:
-                    report.append(f"  {ratio.replace('_', ' ').title()}: {value:.2f}%")
+                    report_append(f"  {title}: {value:.2f}%")
                 else:
-                    report.append(f"  {ratio.replace('_', ' ').title()}: {value:.2f}")
-            report.append("")
+                    report_append(f"  {title}: {value:.2f}")
+            report_append("")
             
         # Sentiment
-        if parsed_data.get('sentiment'):
-            sent = parsed_data['sentiment']
-            report.append("Sentiment Analysis:")
-            report.append("-" * 40)
-            report.append(f"  Overall: {sent['sentiment_label']} ({sent['overall_sentiment']:.2f})")
-            report.append(f"  Positive mentions: {sent['counts']['positive']}")
-            report.append(f"  Negative mentions: {sent['counts']['negative']}")
-            report.append(f"  Uncertainty mentions: {sent['counts']['uncertainty']}")
-            report.append("")
+        if parsed_data.sentiment:
+            sent = parsed_data.sentiment
+            report_append("Sentiment Analysis:")
+            report_append("-" * 40)
+            report_append(f"  Overall: {sent['sentiment_label']} ({sent['overall_sentiment']:.2f})")
+            report_append(f"  Positive mentions: {sent['counts']['positive']}")
+            report_append(f"  Negative mentions: {sent['counts']['negative']}")
+            report_append(f"  Uncertainty mentions: {sent['counts']['uncertainty']}")
+            report_append("")
             
         # Top risks
-        if parsed_data.get('risks'):
-            report.append("Key Risk Factors:")
-            report.append("-" * 40)
-            for i, risk in enumerate(parsed_data['risks'][:3], 1):
-                report.append(f"  {i}. {risk[:100]}...")
-            report.append("")
+        if parsed_data.risks:
+            report_append("Key Risk Factors:")
+            report_append("-" * 40)
+            for i, risk in enumerate(parsed_data.risks[:3], 1):
+                report_append(f"  {i}. {risk[:100]}...")
+            report_append("")
             
         return "\n".join(report)
         
-    def save_results(self, parsed_data: Dict, filepath: str):
+    def save_results(self, parsed_data: FilingResult, filepath: str):
         '''Save parsed results to JSON'''
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(filepath, 'w') as f:
-            json.dump(parsed_data, f, indent=2)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(parsed_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(asdict(parsed_data) if isinstance(parsed_data, FilingResult) else parsed_data, f, indent=2)
             
         print(f'  ✅ Saved results to {filepath}')
 
 
-# Generates representative sample filings for demo/test purposes — not a live EDGAR client
-# Generates representative sample filings for demo/test purposes — not a live EDGAR client
-class MockSECFetcher:
-    '''Mock SEC filing fetcher (for demo)'''
+# Per-process parser and progress setting for parse_corpus workers, set once by _init_worker
+_worker_parser = None
+_worker_verbose = False
+
+
+def _init_worker(verbose: bool):
+    '''Pool initializer: compile one parser per worker process'''
+    global _worker_parser, _worker_verbose
+    _worker_parser = SECFilingParser()
+    _worker_verbose = verbose
+
+
+def _parse_one(filing: Tuple[str, str, str]) -> FilingResult:
+    '''Parse one (text, ticker, filing_type) tuple with the worker's parser'''
+    return _worker_parser.parse_filing(*filing, verbose=_worker_verbose)
+
+
+def parse_corpus(filings: Iterable[Tuple[str, str, str]],
+                 processes: Optional[int] = None,
+                 chunksize: int = 16,
+                 verbose: bool = False) -> Iterator[FilingResult]:
+    '''
+    Parse many filings in parallel, one SECFilingParser per worker process
     
-    @staticmethod
-    def fetch_filing(ticker: str, filing_type: str = '10-K') -> str:
-        '''Generate mock SEC filing text'''
-        return f"""
+    Scripts calling this must do so under an `if __name__ == '__main__':` guard:
+    on macOS and Windows workers are spawned and re-import the main module.
+    
+    Args:
+        filings: Iterable of (text, ticker, filing_type) tuples
+        processes: Number of worker processes (defaults to CPU count)
+        chunksize: Filings handed to a worker per task, to amortize IPC
+        verbose: Print parse_filing's per-step progress (interleaves across workers)
+        
+    Yields:
+        Parsed filing data, in completion order rather than input order
+    '''
+    with Pool(processes, initializer=_init_worker, initargs=(verbose,)) as pool:
+        yield from pool.imap_unordered(_parse_one, filings, chunksize=chunksize)
+
+
+# Generates representative sample filings for demo/test purposes — not a live EDGAR client
+_MOCK_FILING_TEMPLATE = """
         UNITED STATES SECURITIES AND EXCHANGE COMMISSION
         Washington, D.C. 20549
         
@@ -421,6 +609,22 @@ class MockSECFetcher:
         """
 
 
+class MockSECFetcher:
+    '''Mock SEC filing fetcher (for demo)'''
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def fetch_filing(ticker: str, filing_type: str = '10-K') -> str:
+        '''Generate mock SEC filing text (cached per ticker and filing type)'''
+        return _MOCK_FILING_TEMPLATE.format_map({'ticker': ticker, 'filing_type': filing_type})
+        
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def fetch_bytes(ticker: str, filing_type: str = '10-K') -> bytes:
+        '''Mock SEC filing as UTF-8 bytes, encoded once per ticker and filing type'''
+        return MockSECFetcher.fetch_filing(ticker, filing_type).encode('utf-8')
+
+
 def demo():
     '''Comprehensive demonstration'''
     print('Financial Report NLP Parser - Demo')
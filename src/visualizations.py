@@ -2,30 +2,78 @@
 Financial Data Visualization
 '''
 
+import os
+import warnings
+
+import matplotlib
+# Headless raster backend for batch runs; an explicit MPLBACKEND (e.g. Jupyter inline) wins
+if 'MPLBACKEND' not in os.environ:
+    matplotlib.use('Agg')
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+})
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
 from pathlib import Path
 from typing import Dict, List
 
 
 class FinancialVisualizer:
-    '''Visualize financial analysis results'''
+    '''
+    Visualize financial analysis results
+    
+    Plot methods save a PNG and return its path (save=True), or show the chart and
+    return None (save=False). Showing needs an interactive backend; Agg is selected
+    on import unless MPLBACKEND is set (Jupyter sets it), and under Agg save=False
+    only warns.
+    '''
     
     def __init__(self, output_dir: str = 'assets'):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self._fig = None
+        
+    def _get_figure(self, figsize: tuple, save: bool) -> Figure:
+        '''Figure to draw on, cleared and resized for each chart'''
+        if not save:
+            return plt.figure(figsize=figsize)  # plt.show() needs a pyplot-managed figure
+            
+        # Saving reuses one Figure that pyplot does not track, so it is freed with the visualizer
+        if self._fig is None:
+            self._fig = Figure()
+        self._fig.clf()
+        self._fig.set_size_inches(figsize)
+        return self._fig
+        
+    def _show(self, fig: Figure):
+        '''Show a pyplot figure, warning instead when the backend cannot display it'''
+        if matplotlib.get_backend().lower() == 'agg':
+            warnings.warn(
+                'save=False shows nothing on the non-interactive Agg backend; '
+                'set MPLBACKEND to an interactive backend or use save=True',
+                stacklevel=3
+            )
+            plt.close(fig)
+        else:
+            plt.show()
         
     def plot_metrics_comparison(self, 
                                metrics: Dict[str, float],
                                title: str = 'Financial Metrics',
                                save: bool = True) -> str:
         '''Plot financial metrics as bar chart'''
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig = self._get_figure((12, 6), save)
+        ax = fig.add_subplot()
         
-        # Filter and sort metrics
-        sorted_metrics = sorted(metrics.items(), key=lambda x: x[1], reverse=True)
-        names = [m[0].replace('_', ' ').title() for m, v in sorted_metrics]
-        values = [v for m, v in sorted_metrics]
+        # Sort metrics descending (stable, so ties keep their input order)
+        keys = list(metrics)
+        values = np.fromiter(metrics.values(), dtype=np.float64, count=len(keys))
+        order = np.argsort(-values, kind='stable')
+        values = values[order]
+        names = [keys[i].replace('_', ' ').title() for i in order]
         
         colors = plt.cm.viridis(np.linspace(0.3, 0.9, len(names)))
         bars = ax.barh(names, values, color=colors, edgecolor='black', linewidth=1.5)
@@ -41,22 +89,22 @@ class FinancialVisualizer:
         ax.set_title(title, fontsize=14, fontweight='bold')
         ax.grid(axis='x', alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
             filepath = self.output_dir / 'metrics_comparison.png'
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.savefig(filepath, dpi=300, bbox_inches='tight')
             return str(filepath)
         else:
-            plt.show()
+            self._show(fig)
             return None
             
     def plot_sentiment_breakdown(self,
                                 sentiment: Dict,
                                 save: bool = True) -> str:
         '''Visualize sentiment analysis'''
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+        fig = self._get_figure((14, 5), save)
+        ax1, ax2 = fig.subplots(1, 2)
         
         # Counts pie chart
         counts = sentiment['counts']
@@ -81,24 +129,24 @@ class FinancialVisualizer:
             ax2.text(i, v + 0.01, f'{v:.2f}', 
                     ha='center', va='bottom', fontweight='bold')
         
-        plt.suptitle(f'Overall Sentiment: {sentiment["sentiment_label"]}',
+        fig.suptitle(f'Overall Sentiment: {sentiment["sentiment_label"]}',
                     fontsize=14, fontweight='bold')
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
             filepath = self.output_dir / 'sentiment_analysis.png'
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.savefig(filepath, dpi=300, bbox_inches='tight')
             return str(filepath)
         else:
-            plt.show()
+            self._show(fig)
             return None
             
     def plot_financial_ratios(self,
                              ratios: Dict[str, float],
                              save: bool = True) -> str:
         '''Visualize financial ratios'''
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig = self._get_figure((10, 6), save)
+        ax = fig.add_subplot()
         
         names = [r.replace('_', ' ').title() for r in ratios.keys()]
         values = list(ratios.values())
@@ -116,29 +164,28 @@ class FinancialVisualizer:
         ax.set_ylabel('Ratio Value', fontsize=12)
         ax.set_title('Key Financial Ratios', fontsize=14, fontweight='bold')
         ax.grid(axis='y', alpha=0.3)
-        plt.xticks(rotation=15, ha='right')
-        plt.tight_layout()
+        plt.setp(ax.get_xticklabels(), rotation=15, ha='right')
+        fig.tight_layout()
         
         if save:
             filepath = self.output_dir / 'financial_ratios.png'
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.savefig(filepath, dpi=300, bbox_inches='tight')
             return str(filepath)
         else:
-            plt.show()
+            self._show(fig)
             return None
             
     def create_dashboard(self,
                         parsed_data: Dict,
                         save: bool = True) -> str:
-        '''Create comprehensive analysis dashboard'''
-        fig = plt.figure(figsize=(16, 10))
+        '''Create comprehensive analysis dashboard from a parser FilingResult or a plain dict'''
+        fig = self._get_figure((16, 10), save)
         
         # 2x2 layout
-        ax1 = plt.subplot(2, 2, 1)
-        ax2 = plt.subplot(2, 2, 2)
-        ax3 = plt.subplot(2, 2, 3)
-        ax4 = plt.subplot(2, 2, 4)
+        ax1 = fig.add_subplot(2, 2, 1)
+        ax2 = fig.add_subplot(2, 2, 2)
+        ax3 = fig.add_subplot(2, 2, 3)
+        ax4 = fig.add_subplot(2, 2, 4)
         
         # 1. Top metrics
         metrics = parsed_data.get('metrics', {})
@@ -189,17 +236,16 @@ class FinancialVisualizer:
                 fontfamily='monospace',
                 fontsize=12)
         
-        plt.suptitle('Financial Analysis Dashboard',
+        fig.suptitle('Financial Analysis Dashboard',
                     fontsize=16, fontweight='bold')
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
             filepath = self.output_dir / 'analysis_dashboard.png'
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.savefig(filepath, dpi=300, bbox_inches='tight')
             return str(filepath)
         else:
-            plt.show()
+            self._show(fig)
             return None
 
 
@@ -0,0 +1,118 @@
+'''Tests for the SEC filing parser'''
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+from parser import (EntityExtractor, FinancialMetricExtractor, SECFilingParser, SentimentAnalyzer,
+                    _AMOUNT_TAIL, _PER_SHARE_TAIL)
+
+
+# Reference implementations: one independent search or count per pattern, as the parser
+# did before the scans were fused
+
+def _reference_metrics(text):
+    text_lower = text.lower()
+    metrics = {}
+    for name, keyword in FinancialMetricExtractor._KEYWORDS.items():
+        pattern = re.compile(keyword + (_PER_SHARE_TAIL if name == 'earnings_per_share' else _AMOUNT_TAIL))
+        match = pattern.search(text_lower)
+        if match:
+            try:
+                value = float(match.group('value').replace(',', ''))
+            except ValueError:
+                continue
+            if 'unit' in pattern.groupindex and match.group('unit') == 'billion':
+                value *= 1000
+            metrics[name] = value
+    return metrics
+
+
+def _reference_counts(text):
+    text_lower = text.lower()
+    return {
+        category: sum(len(re.findall(r'\b' + re.escape(word) + r'\b', text_lower, re.ASCII)) for word in lexicon)
+        for category, lexicon in SentimentAnalyzer._LEXICONS.items()
+    }
+
+
+def _reference_risks(text):
+    keywords = ['risk', 'uncertainty', 'adverse', 'challenge', 'concern']
+    risks = []
+    for sentence in re.split(r'[.!?]+', text):
+        if any(keyword in sentence.lower() for keyword in keywords) and len(sentence.strip()) > 50:
+            risks.append(sentence.strip())
+    return risks[:10]
+
+
+def _random_text(rng, words, max_words=40):
+    return ' '.join(rng.choice(words) for _ in range(rng.randint(0, max_words)))
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Revenue rose; net income $3 billion.', {'revenue': 3000.0, 'net_income': 3000.0}),
+    ('Operating income grew, gross profit $5, net income $2',
+     {'net_income': 2.0, 'gross_profit': 5.0, 'operating_income': 5.0}),
+    ('Cash and cash equivalents ... net income of $5 million', {'net_income': 5.0}),
+    ('Stockholders equity includes total assets of $9 million', {'total_assets': 9.0, 'stockholders_equity': 9.0}),
+])
+def test_extract_metrics_overlapping_keywords(text, expected):
+    assert FinancialMetricExtractor().extract_metrics(text) == expected
+    assert _reference_metrics(text) == expected
+
+
+def test_extract_metrics_matches_per_pattern_search():
+    words = ['revenue', 'sales', 'net', 'income', 'Net Sales', 'earnings per share', 'gross profit',
+             'operating', 'total assets', 'total liabilities', 'cash', 'and', 'equivalents', 'stockholders',
+             'shareholders equity', '$', '$1,200', '3.5', '.', ',', 'million', 'billion', '\n', 'x', '12']
+    rng = random.Random(0)
+    extractor = FinancialMetricExtractor()
+    for _ in range(5000):
+        text = _random_text(rng, words)
+        assert extractor.extract_metrics(text) == _reference_metrics(text), repr(text)
+
+
+def test_extract_metrics_large_text_is_linear():
+    # Every line opens two keywords with no amount after them; a scan that re-reads the rest
+    # of the text per keyword hit takes seconds here
+    text = 'our sales team and total assets grew.\n' * 8000 + 'net income $5 million'
+    extractor = FinancialMetricExtractor()
+    start = time.perf_counter()
+    assert extractor.extract_metrics(text) == {'net_income': 5.0}
+    assert time.perf_counter() - start < 1.0
+
+
+def test_analyze_text_counts_whole_words():
+    counts = SentimentAnalyzer().analyze_text('To our dismay, profit may grow.')['counts']
+    assert counts == {'positive': 1, 'negative': 0, 'uncertainty': 1}
+
+
+def test_analyze_text_matches_per_word_counts():
+    words = [word for lexicon in SentimentAnalyzer._LEXICONS.values() for word in lexicon]
+    words += ['dismay', 'growths', 'Profit', 'subject', 'to', 'x', ',', '.', '\n']
+    rng = random.Random(1)
+    analyzer = SentimentAnalyzer()
+    for _ in range(2000):
+        text = _random_text(rng, words)
+        assert analyzer.analyze_text(text)['counts'] == _reference_counts(text), repr(text)
+
+
+def test_extract_risk_factors_matches_split():
+    words = ['Risk', 'risks', 'adverse', 'challenge', 'concern', 'uncertainty', 'the', 'company',
+             'operations', 'market', 'conditions', 'could', '.', '!', '?', '...', '\n']
+    rng = random.Random(2)
+    parser = SECFilingParser()
+    for _ in range(2000):
+        text = _random_text(rng, words, max_words=120)
+        assert parser._extract_risk_factors(text) == _reference_risks(text), repr(text)
+
+
+def test_extract_entities_folds_ascii_case_only():
+    # RE2's (?i) would fold the Kelvin sign and long s into k and s; the re fallback does not
+    entities = EntityExtractor().extract_entities('Acme Inc. and \u212aelvin CORP. and Bo\u017fs Ltd. on \u017fEPTEMBER 3, 2021 or june 30, 2020')
+    assert sorted(entities['company']) == ['Acme Inc.', 'elvin CORP.']
+    assert entities['date'] == ['june 30, 2020']